@@ -1,6 +1,7 @@
 from typing import Dict, List, Tuple, Optional
 from TalentScout.resume_analyzer import ResumeAnalyzer
-from TalentScout.chat_engine import chat
+from TalentScout.chat_engine import chat, chat_json, parse_questions, InterviewQuestion, QUESTION_ATTEMPTS
+from TalentScout.matching import normalize_tech_stack
 import re
 
 class ChatState:
@@ -12,7 +13,7 @@ class ChatState:
 
 class TechnicalAssessment:
     def __init__(self, tech_stack: str):
-        self.tech_stack = tech_stack.lower().split(',')
+        self.tech_stack = normalize_tech_stack(tech_stack)
         self.current_question_index = 0
         self.questions = []
         self.answers = []
@@ -24,7 +25,8 @@ class TechnicalAssessment:
         prompt = [
             {
                 "role": "system",
-                "content": "You are an expert technical interviewer. Generate specific, technical questions based on the candidate's tech stack."
+                "content": "You are an expert technical interviewer. Generate specific, technical questions based on the candidate's tech stack. "
+                           'Reply only with JSON of the form {"questions": [{"question": "...?", "topic": "..."}]}.'
             },
             {
                 "role": "user",
@@ -32,9 +34,24 @@ class TechnicalAssessment:
             }
         ]
         
-        response = chat(prompt)
-        # Split response into questions
-        self.questions = [q.strip() for q in response["content"].split('\n') if '?' in q][:5]
+        self.question_items: List[InterviewQuestion] = []
+        for _ in range(QUESTION_ATTEMPTS):
+            questions = parse_questions(chat_json(prompt, task="technical_questions"))
+            if len(questions) > len(self.question_items):
+                self.question_items = questions
+            if len(self.question_items) >= 5:
+                break
+
+        # Fall back to generic questions so the assessment never starts empty
+        if not self.question_items:
+            self.question_items = [
+                InterviewQuestion(
+                    text=f"Can you describe a project where you used {tech} and the main technical challenges you faced?",
+                    topic=tech
+                )
+                for tech in (self.tech_stack or ["your main technologies"])[:5]
+            ]
+        self.questions = [q.text for q in self.question_items]
         
     def get_next_question(self) -> Optional[str]:
         """Retrieve one question at a time from stored questions."""
@@ -160,12 +177,12 @@ class ChatManager:
                 },
                 {
                     "role": "user",
-                    "content": f"Current technical interview context:\n- Position: {self.candidate_data['desired_position']}\n- Experience: {self.candidate_data['years_of_experience']} years\n- Tech Stack: {self.candidate_data['tech_stack']}\n\nPrevious question: {current_question}\nCandidate's answer: {message}\n\nProvide a brief, technical evaluation of the answer and transition to the next question."
+                    "content": f"Current technical interview context:\n- Position: {self.candidate_data['desired_position']}\n- Experience: {self.candidate_data['years_of_experience']} years\n- Tech Stack: {self.candidate_data['tech_stack']}\n\nPrevious question: {current_question}\nCandidate's answer: {message}\n\nProvide a brief, technical evaluation of the answer in 2-3 sentences. Do not write the next question."
                 }
             ]
             
-            response = chat(prompt)
-            response_content = response["content"]
+            response = chat(prompt, task="answer_evaluation")
+            response_content = response["content"].strip()
         else:
             response_content = ""
 
@@ -1,18 +1,86 @@
-from typing import List, Dict
+import json
+from dataclasses import dataclass
+from typing import Any, List, Dict, Optional
 
 import ollama
 
+MODEL = "llama3.2:latest"
 
-def chat(message: List[Dict[str, str]]) -> Dict[str, str]:
+# Question generation is retried once if the reply yields fewer questions than asked for
+QUESTION_ATTEMPTS = 2
+
+# Per-task generation limits. JSON mode can keep emitting whitespace after the
+# object is closed, so every structured task gets a hard num_predict cap, sized
+# to fit five questions with topics.
+TASK_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "technical_questions": {"num_predict": 512, "temperature": 0.7, "stop": ["\n\n\n"]},
+    "resume_questions": {"num_predict": 512, "temperature": 0.7, "stop": ["\n\n\n"]},
+    "answer_evaluation": {"num_predict": 160, "stop": ["Next question", "\n\n\n"]},
+}
+
+
+@dataclass
+class InterviewQuestion:
+    text: str
+    topic: str = ""
+
+
+def chat(message: List[Dict[str, str]], task: Optional[str] = None) -> Dict[str, str]:
     """
     Chat with the Ollama chatbot.
 
     Args: message (List[Dict[str, str]]): A list of messages in the conversation. Each message is represented as a
     dictionary with "role" and "content" keys.
-    
+    task (Optional[str]): Name of an entry in TASK_OPTIONS whose generation limits should be applied.
+
     Returns:
         str: The response message from the chatbot.
 
     """
-    response = ollama.chat(model="llama3.2:latest", messages=message,)
-    return response["message"]
\ No newline at end of file
+    response = ollama.chat(model=MODEL, messages=message, options=TASK_OPTIONS.get(task))
+    return response["message"]
+
+
+def chat_json(message: List[Dict[str, str]], task: str) -> Dict[str, Any]:
+    """
+    Chat with the Ollama chatbot in JSON mode.
+
+    Args:
+        message (List[Dict[str, str]]): The conversation, as for chat().
+        task (str): Name of an entry in TASK_OPTIONS whose generation limits should be applied.
+
+    Returns:
+        Dict[str, Any]: The decoded JSON object, or an empty dict if the reply was not valid JSON.
+    """
+    response = ollama.chat(model=MODEL, messages=message, format="json", options=TASK_OPTIONS[task])
+    try:
+        payload = json.loads(response["message"]["content"])
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def parse_questions(payload: Any, limit: int = 5) -> List[InterviewQuestion]:
+    """Parse a {"questions": [{"question": ..., "topic": ...}]} payload into InterviewQuestion objects."""
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(payload, dict) or not isinstance(payload.get("questions"), list):
+        return []
+
+    questions = []
+    for item in payload["questions"]:
+        if isinstance(item, str):
+            item = {"question": item}
+        if not isinstance(item, dict) or not isinstance(item.get("question"), str):
+            continue
+        text = item["question"].strip()
+        if not text:
+            continue
+        topic = item.get("topic") if isinstance(item.get("topic"), str) else ""
+        questions.append(InterviewQuestion(text=text, topic=topic.strip()))
+        if len(questions) >= limit:
+            break
+    return questions
@@ -1,13 +1,18 @@
 import sqlite3
 import json
+import time
+import zlib
+
+# Running totals for reads served from the compressed archive
+archive_read_stats = {"reads": 0, "seconds": 0.0}
 
 # Create a global database connection
 connection = sqlite3.connect("TalentScout.db", check_same_thread=False)
 
-def initialize_database():
+def initialize_database(conn=connection):
     """Initialize the database with required tables."""
-    with connection:
-        cursor = connection.cursor()
+    with conn:
+        cursor = conn.cursor()
         # Table for candidates
         cursor.execute(
             """
@@ -36,6 +41,38 @@ def initialize_database():
             );
             """
         )
+        # Table for archived (zlib-compressed) transcripts, one row per candidate
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversation_archive (
+                candidate_id INTEGER PRIMARY KEY,
+                message_count INTEGER,
+                raw_bytes INTEGER,
+                compressed_bytes INTEGER,
+                first_date DATETIME,
+                last_date DATETIME,
+                archived_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                payload BLOB,
+                FOREIGN KEY (candidate_id) REFERENCES candidates(id)
+            );
+            """
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_conversations_candidate_date ON conversations (candidate_id, date)"
+        )
+        # Table for incremental export checkpoints
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS export_checkpoints (
+                name TEXT,
+                table_name TEXT,
+                last_id INTEGER,
+                filters TEXT,
+                exported_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (name, table_name)
+            );
+            """
+        )
 
 def insert_candidate(full_name, email, phone, years_of_experience, desired_position, current_location, tech_stack):
     """Insert a new candidate into the database and return the candidate ID."""
@@ -48,7 +85,10 @@ def insert_candidate(full_name, email, phone, years_of_experience, desired_posit
             """,
             (full_name, email, phone, years_of_experience, desired_position, current_location, tech_stack),
         )
-        return cursor.lastrowid
+        candidate_id = cursor.lastrowid
+    from TalentScout.matching import notify_candidate_inserted
+    notify_candidate_inserted(candidate_id, tech_stack, years_of_experience, current_location)
+    return candidate_id
 
 def insert_conversation(candidate_id, role, content):
     """Insert a conversation message into the database."""
@@ -76,12 +116,102 @@ def get_all_candidates():
         cursor.execute("SELECT * FROM candidates")
         return cursor.fetchall()
 
+def _load_archived_conversations(cursor, candidate_id):
+    """Decompress the archived transcript of a candidate, if any."""
+    cursor.execute("SELECT payload FROM conversation_archive WHERE candidate_id = ?", (candidate_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return []
+    return [tuple(conv) for conv in json.loads(zlib.decompress(row[0]))]
+
+def _read_archived_conversations(cursor, candidate_id):
+    """Serve the archived transcript of a candidate, recording the read in archive_read_stats."""
+    start = time.perf_counter()
+    conversations = _load_archived_conversations(cursor, candidate_id)
+    if conversations:
+        archive_read_stats["reads"] += 1
+        archive_read_stats["seconds"] += time.perf_counter() - start
+    return conversations
+
 def get_conversations_by_candidate_id(candidate_id):
-    """Retrieve all conversations for a candidate ordered by date."""
+    """Retrieve all conversations for a candidate ordered by date, including archived ones."""
     with connection:
         cursor = connection.cursor()
+        archived = _read_archived_conversations(cursor, candidate_id)
         cursor.execute(
             "SELECT * FROM conversations WHERE candidate_id = ? ORDER BY date ASC", 
             (candidate_id,)
         )
-        return cursor.fetchall()
\ No newline at end of file
+        return archived + cursor.fetchall()
+
+def archive_conversations(candidate_id):
+    """Move a candidate's transcript into the compressed archive and return the number of messages moved."""
+    with connection:
+        cursor = connection.cursor()
+        cursor.execute(
+            "SELECT * FROM conversations WHERE candidate_id = ? ORDER BY date ASC, id ASC",
+            (candidate_id,)
+        )
+        hot = cursor.fetchall()
+        if not hot:
+            return 0
+        conversations = _load_archived_conversations(cursor, candidate_id) + hot
+        raw = json.dumps(conversations, separators=(",", ":")).encode("utf-8")
+        payload = zlib.compress(raw, 9)
+        cursor.execute(
+            """
+            INSERT OR REPLACE INTO conversation_archive
+                (candidate_id, message_count, raw_bytes, compressed_bytes, first_date, last_date, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (candidate_id, len(conversations), len(raw), len(payload),
+             conversations[0][4], conversations[-1][4], payload),
+        )
+        cursor.execute(
+            "DELETE FROM conversations WHERE candidate_id = ? AND id <= ?",
+            (candidate_id, max(conv[0] for conv in hot))
+        )
+        return len(hot)
+
+def archive_stale_conversations(older_than_days=30):
+    """Archive every transcript whose latest message is older than the threshold."""
+    with connection:
+        cursor = connection.cursor()
+        cursor.execute(
+            """
+            SELECT candidate_id FROM conversations
+            GROUP BY candidate_id
+            HAVING MAX(date) < datetime('now', ?)
+            """,
+            (f"-{int(older_than_days)} days",)
+        )
+        candidate_ids = [row[0] for row in cursor.fetchall()]
+    return sum(archive_conversations(candidate_id) for candidate_id in candidate_ids)
+
+def compact_database():
+    """Reclaim the space freed by archiving."""
+    connection.execute("VACUUM")
+
+def get_archive_stats():
+    """Report space savings and read latency of the transcript archive."""
+    with connection:
+        cursor = connection.cursor()
+        cursor.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(message_count), 0),
+                   COALESCE(SUM(raw_bytes), 0), COALESCE(SUM(compressed_bytes), 0)
+            FROM conversation_archive
+            """
+        )
+        transcripts, messages, raw_bytes, compressed_bytes = cursor.fetchone()
+    reads = archive_read_stats["reads"]
+    return {
+        "archived_transcripts": transcripts,
+        "archived_messages": messages,
+        "raw_bytes": raw_bytes,
+        "compressed_bytes": compressed_bytes,
+        "bytes_saved": raw_bytes - compressed_bytes,
+        "compression_ratio": raw_bytes / compressed_bytes if compressed_bytes else 0.0,
+        "archive_reads": reads,
+        "avg_read_ms": archive_read_stats["seconds"] * 1000 / reads if reads else 0.0,
+    }
@@ -0,0 +1,269 @@
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+import zlib
+from typing import Iterable, Iterator, Optional, Tuple
+
+from TalentScout.database import connection, initialize_database
+
+BATCH_SIZE = 5000
+
+CANDIDATE_COLUMNS = [
+    "id", "full_name", "email", "phone", "years_of_experience",
+    "desired_position", "current_location", "tech_stack"
+]
+CONVERSATION_COLUMNS = ["id", "candidate_id", "role", "content", "date"]
+COLUMNS = {"candidates": CANDIDATE_COLUMNS, "conversations": CONVERSATION_COLUMNS}
+# Parquet types by column name; every other column is a string
+PARQUET_TYPES = {"id": "int64", "candidate_id": "int64", "years_of_experience": "int64"}
+FORMATS = ["jsonl", "csv", "parquet"]
+
+
+def _iter_cursor(cursor, batch_size: int) -> Iterator[Tuple]:
+    """Yield rows from an executed cursor in fetchmany batches."""
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+
+def iter_candidates(conn=connection, position: Optional[str] = None, since_id: int = 0,
+                    batch_size: int = BATCH_SIZE) -> Iterator[Tuple]:
+    """Stream candidates with id greater than since_id, optionally filtered by desired position."""
+    query = "SELECT * FROM candidates WHERE id > ?"
+    params = [since_id]
+    if position:
+        query += " AND desired_position LIKE ?"
+        params.append(f"%{position}%")
+    cursor = conn.cursor()
+    cursor.execute(query + " ORDER BY id", params)
+    yield from _iter_cursor(cursor, batch_size)
+
+
+def iter_conversations(conn=connection, start_date: Optional[str] = None, end_date: Optional[str] = None,
+                       position: Optional[str] = None, since_id: int = 0,
+                       batch_size: int = BATCH_SIZE) -> Iterator[Tuple]:
+    """
+    Stream conversation messages, archived transcripts first, then the live table.
+
+    Args:
+        start_date (Optional[str]): Inclusive lower bound on the message date ("YYYY-MM-DD[ HH:MM:SS]").
+        end_date (Optional[str]): Exclusive upper bound on the message date.
+        position (Optional[str]): Only messages of candidates whose desired position matches.
+        since_id (int): Only messages with an id greater than this.
+    """
+    candidate_filter = ""
+    params = []
+    if position:
+        candidate_filter = " AND candidate_id IN (SELECT id FROM candidates WHERE desired_position LIKE ?)"
+        params.append(f"%{position}%")
+
+    # Archived transcripts are decompressed one candidate at a time
+    cursor = conn.cursor()
+    cursor.execute("SELECT payload FROM conversation_archive WHERE 1 = 1" + candidate_filter, params)
+    for (payload,) in _iter_cursor(cursor, 1):
+        for conv in json.loads(zlib.decompress(payload)):
+            if conv[0] <= since_id:
+                continue
+            if start_date and conv[4] < start_date:
+                continue
+            if end_date and conv[4] >= end_date:
+                continue
+            yield tuple(conv)
+
+    query = "SELECT * FROM conversations WHERE id > ?" + candidate_filter
+    params = [since_id] + params
+    if start_date:
+        query += " AND date >= ?"
+        params.append(start_date)
+    if end_date:
+        query += " AND date < ?"
+        params.append(end_date)
+    cursor = conn.cursor()
+    cursor.execute(query + " ORDER BY id", params)
+    yield from _iter_cursor(cursor, batch_size)
+
+
+def write_jsonl(rows: Iterable[Tuple], columns, output) -> int:
+    """Write rows as JSON lines to a text stream and return the row count."""
+    count = 0
+    for row in rows:
+        output.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def write_csv(rows: Iterable[Tuple], columns, output) -> int:
+    """Write rows as CSV with a header to a text stream and return the row count."""
+    writer = csv.writer(output)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_parquet(rows: Iterable[Tuple], columns, output, batch_size: int = BATCH_SIZE) -> int:
+    """Write rows as Parquet row groups to a binary stream and return the row count. Requires pyarrow."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+
+    # An explicit schema keeps all-None columns in the first batch from being typed as null
+    schema = pa.schema([
+        (column, pa.type_for_alias(PARQUET_TYPES.get(column, "string"))) for column in columns
+    ])
+    writer = pq.ParquetWriter(output, schema)
+    count = 0
+    batch = []
+
+    def flush():
+        writer.write_table(pa.Table.from_pylist([dict(zip(columns, row)) for row in batch], schema=schema))
+        batch.clear()
+
+    for row in rows:
+        batch.append(row)
+        count += 1
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    writer.close()
+    return count
+
+
+def _checkpoint_filters(start_date: Optional[str], end_date: Optional[str], position: Optional[str]) -> str:
+    return json.dumps({"start_date": start_date, "end_date": end_date, "position": position}, sort_keys=True)
+
+
+def get_export_checkpoint(name: str, table: str, conn=connection, filters: Optional[str] = None) -> int:
+    """
+    Return the last exported id for a named incremental export, or 0.
+
+    A checkpoint only covers rows that matched its filters, so resuming it with different filters
+    would silently skip rows; that raises ValueError instead.
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT last_id, filters FROM export_checkpoints WHERE name = ? AND table_name = ?",
+        (name, table)
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return 0
+    last_id, stored_filters = row
+    if filters is not None and stored_filters is not None and stored_filters != filters:
+        raise ValueError(
+            f"Checkpoint '{name}' for {table} was created with filters {stored_filters}; "
+            f"use the same filters or a new checkpoint name"
+        )
+    return last_id
+
+
+def set_export_checkpoint(name: str, table: str, last_id: int, conn=connection, filters: Optional[str] = None):
+    """Record the last exported id, and the filters it applies to, for a named incremental export."""
+    with conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO export_checkpoints (name, table_name, last_id, filters, exported_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """,
+            (name, table, last_id, filters),
+        )
+
+
+def export(table: str, fmt: str, output, conn=connection, start_date: Optional[str] = None,
+           end_date: Optional[str] = None, position: Optional[str] = None,
+           checkpoint: Optional[str] = None, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Stream a table to output in constant memory.
+
+    Args:
+        table (str): "candidates" or "conversations".
+        fmt (str): "jsonl" or "csv" (text output), or "parquet" (binary output).
+        output: Open file object to write to.
+        start_date, end_date (Optional[str]): Date range for conversations.
+        position (Optional[str]): Desired position filter.
+        checkpoint (Optional[str]): Name of an incremental export; only rows added since its last run are
+            written, and the checkpoint is advanced afterwards. A checkpoint is tied to the filters of its
+            first run; reusing it with other filters raises ValueError.
+
+    Returns:
+        int: The number of rows written.
+    """
+    if table not in COLUMNS:
+        raise ValueError(f"Unsupported table: {table}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    filters = _checkpoint_filters(start_date, end_date, position)
+    since_id = get_export_checkpoint(checkpoint, table, conn, filters) if checkpoint else 0
+    if table == "candidates":
+        rows = iter_candidates(conn, position, since_id, batch_size)
+    else:
+        rows = iter_conversations(conn, start_date, end_date, position, since_id, batch_size)
+
+    last_id = since_id
+
+    def track(rows):
+        nonlocal last_id
+        for row in rows:
+            last_id = max(last_id, row[0])
+            yield row
+
+    writer = {"jsonl": write_jsonl, "csv": write_csv, "parquet": write_parquet}[fmt]
+    count = writer(track(rows), COLUMNS[table], output)
+
+    if checkpoint:
+        set_export_checkpoint(checkpoint, table, last_id, conn, filters)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream TalentScout candidates or transcripts to a file.")
+    parser.add_argument("table", choices=sorted(COLUMNS))
+    parser.add_argument("--format", dest="fmt", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", "-o", default="-", help="Output file (default: stdout)")
+    parser.add_argument("--database", default="TalentScout.db")
+    parser.add_argument("--start-date", help="Inclusive lower bound on conversation date")
+    parser.add_argument("--end-date", help="Exclusive upper bound on conversation date")
+    parser.add_argument("--position", help="Filter by desired position")
+    parser.add_argument("--checkpoint", help="Name of an incremental export to resume; tied to its filters")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    conn = sqlite3.connect(args.database)
+    initialize_database(conn)
+    options = dict(conn=conn, start_date=args.start_date, end_date=args.end_date, position=args.position,
+                   checkpoint=args.checkpoint, batch_size=args.batch_size)
+    binary = args.fmt == "parquet"
+    if args.checkpoint:
+        # Check before the output file is opened and truncated
+        try:
+            get_export_checkpoint(args.checkpoint, args.table, conn,
+                                  _checkpoint_filters(args.start_date, args.end_date, args.position))
+        except ValueError as e:
+            conn.close()
+            parser.error(str(e))
+    try:
+        if args.output == "-":
+            output = sys.stdout.buffer if binary else sys.stdout
+            count = export(args.table, args.fmt, output, **options)
+        else:
+            mode = "wb" if binary else "w"
+            with open(args.output, mode, **({} if binary else {"newline": "", "encoding": "utf-8"})) as output:
+                count = export(args.table, args.fmt, output, **options)
+    finally:
+        conn.close()
+    print(f"Exported {count} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+# Common spellings mapped onto one vocabulary entry
+SKILL_ALIASES = {
+    "py": "python",
+    "python3": "python",
+    "js": "javascript",
+    "es6": "javascript",
+    "ts": "typescript",
+    "react.js": "react",
+    "reactjs": "react",
+    "react js": "react",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "angularjs": "angular",
+    "angular.js": "angular",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "node js": "node.js",
+    "express.js": "express",
+    "expressjs": "express",
+    "next.js": "nextjs",
+    "golang": "go",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "postgres": "postgresql",
+    "psql": "postgresql",
+    "mongo": "mongodb",
+    "k8s": "kubernetes",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "sklearn": "scikit-learn",
+    "scikit learn": "scikit-learn",
+    "tf": "tensorflow",
+    "rest": "rest api",
+    "restful": "rest api",
+    "restful api": "rest api",
+}
+
+REQUIRED_WEIGHT = 1.0
+NICE_TO_HAVE_WEIGHT = 0.5
+
+
+def normalize_skill(skill: str) -> str:
+    """Normalize a single skill name into its vocabulary form."""
+    skill = re.sub(r"\s+", " ", skill.strip().lower())
+    return SKILL_ALIASES.get(skill, skill)
+
+
+def normalize_tech_stack(tech_stack: Optional[str]) -> List[str]:
+    """Split a free-text tech stack into unique, normalized skills, keeping their order."""
+    skills = []
+    for part in re.split(r"[,;/|\n]+", tech_stack or ""):
+        skill = normalize_skill(part)
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+def normalize_location(location: Optional[str]) -> str:
+    return re.sub(r"\s+", " ", (location or "").strip().lower())
+
+
+@dataclass
+class RoleSpec:
+    required_skills: List[str] = field(default_factory=list)
+    nice_to_have_skills: List[str] = field(default_factory=list)
+    min_years_of_experience: int = 0
+    location: Optional[str] = None
+
+
+class CandidateMatcher:
+    """Sparse candidate x skill matrix that scores every candidate against a role in one pass."""
+
+    def __init__(self):
+        self.vocabulary: Dict[str, int] = {}
+        self.locations: Dict[str, int] = {}
+        self._matrix = sp.csr_matrix((0, 0), dtype=np.float32)
+        self._candidate_ids = np.empty(0, dtype=np.int64)
+        self._years = np.empty(0, dtype=np.float32)
+        self._location_codes = np.empty(0, dtype=np.int32)
+        self._pending: List[Tuple[int, List[int], float, int]] = []
+        self._known_ids = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._candidate_ids) + len(self._pending)
+
+    def add_candidate(self, candidate_id: int, tech_stack: Optional[str], years_of_experience=0,
+                      current_location: Optional[str] = None):
+        """Queue a candidate row; it is merged into the matrix on the next query. Known ids are ignored."""
+        with self._lock:
+            if candidate_id in self._known_ids:
+                return
+            self._known_ids.add(candidate_id)
+            columns = [
+                self.vocabulary.setdefault(skill, len(self.vocabulary))
+                for skill in normalize_tech_stack(tech_stack)
+            ]
+            location = normalize_location(current_location)
+            location_code = self.locations.setdefault(location, len(self.locations))
+            self._pending.append((candidate_id, columns, float(years_of_experience or 0), location_code))
+
+    def load(self, conn, batch_size: int = 5000):
+        """Add every candidate stored in the database."""
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, tech_stack, years_of_experience, current_location FROM candidates ORDER BY id")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for candidate_id, tech_stack, years, location in rows:
+                self.add_candidate(candidate_id, tech_stack, years, location)
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        """Append pending candidates to the matrix. Caller must hold the lock."""
+        n_skills = len(self.vocabulary)
+        if not self._pending:
+            if self._matrix.shape[1] != n_skills:
+                self._matrix = self._widened(n_skills)
+            return
+
+        indptr = np.zeros(len(self._pending) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(columns) for _, columns, _, _ in self._pending])
+        indices = np.fromiter(
+            (column for _, columns, _, _ in self._pending for column in columns),
+            dtype=np.int32, count=int(indptr[-1])
+        )
+        new_rows = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(self._pending), n_skills)
+        )
+        self._matrix = sp.vstack([self._widened(n_skills), new_rows], format="csr")
+
+        ids, _, years, location_codes = zip(*self._pending)
+        self._candidate_ids = np.concatenate([self._candidate_ids, np.array(ids, dtype=np.int64)])
+        self._years = np.concatenate([self._years, np.array(years, dtype=np.float32)])
+        self._location_codes = np.concatenate(
+            [self._location_codes, np.array(location_codes, dtype=np.int32)]
+        )
+        self._pending = []
+
+    def _widened(self, n_skills: int) -> sp.csr_matrix:
+        """
+        Return the matrix with n_skills columns as a new object sharing the same arrays.
+
+        rank() keeps using the matrix it read under the lock, so it must never be resized in place.
+        """
+        matrix = self._matrix
+        return sp.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], n_skills))
+
+    def _skill_vector(self, skills: List[str]) -> Tuple[np.ndarray, int]:
+        """Indicator vector over the vocabulary, plus the number of distinct requested skills."""
+        vector = np.zeros(len(self.vocabulary), dtype=np.float32)
+        wanted = {normalize_skill(skill) for skill in skills if normalize_skill(skill)}
+        for skill in wanted:
+            if skill in self.vocabulary:
+                vector[self.vocabulary[skill]] = 1.0
+        return vector, len(wanted)
+
+    def rank(self, role: RoleSpec, top_k: int = 10) -> List[Tuple[int, float]]:
+        """
+        Score all candidates against a role and return the best matches.
+
+        The score is REQUIRED_WEIGHT times the fraction of required skills a candidate has, plus
+        NICE_TO_HAVE_WEIGHT times the fraction of nice-to-have skills. Candidates below the minimum
+        experience or outside the location are excluded, as are candidates with none of the required
+        skills (or, for a role with only nice-to-have skills, none of those).
+
+        Returns:
+            List[Tuple[int, float]]: (candidate_id, score) pairs, best first.
+        """
+        with self._lock:
+            self._flush()
+            matrix, candidate_ids = self._matrix, self._candidate_ids
+            years, location_codes = self._years, self._location_codes
+            required, n_required = self._skill_vector(role.required_skills)
+            nice, n_nice = self._skill_vector(role.nice_to_have_skills)
+            location = normalize_location(role.location)
+            location_matches = [code for name, code in self.locations.items() if location and location in name]
+
+        if not len(candidate_ids) or top_k <= 0:
+            return []
+
+        eligible = years >= role.min_years_of_experience
+        scores = np.zeros(len(candidate_ids), dtype=np.float32)
+        if n_required:
+            required_hits = matrix @ required
+            eligible &= required_hits > 0
+            scores += REQUIRED_WEIGHT * required_hits / n_required
+        if n_nice:
+            scores += NICE_TO_HAVE_WEIGHT * (matrix @ nice) / n_nice
+
+        if location:
+            eligible &= np.isin(location_codes, location_matches)
+        if n_nice and not n_required:
+            eligible &= scores > 0
+        scores[~eligible] = -np.inf
+
+        top_k = min(top_k, int(eligible.sum()))
+        if top_k == 0:
+            return []
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(candidate_ids[i]), float(scores[i])) for i in top]
+
+
+_matcher: Optional[CandidateMatcher] = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher() -> CandidateMatcher:
+    """Return the shared matcher, building it from the database on first use."""
+    global _matcher
+    with _matcher_lock:
+        if _matcher is None:
+            from TalentScout.database import connection
+            matcher = CandidateMatcher()
+            matcher.load(connection)
+            _matcher = matcher
+        return _matcher
+
+
+def notify_candidate_inserted(candidate_id, tech_stack, years_of_experience, current_location):
+    """
+    Keep the shared matcher in sync with insert_candidate.
+
+    Holding _matcher_lock means a concurrent build either already loaded the row (and add_candidate
+    ignores it) or finishes first, so the row is added here.
+    """
+    with _matcher_lock:
+        if _matcher is not None:
+            _matcher.add_candidate(candidate_id, tech_stack, years_of_experience, current_location)
@@ -8,10 +8,13 @@ from llama_index.embeddings.huggingface import HuggingFaceEmbedding
 from llama_index.core import Document
 import streamlit as st
 import chardet
+from TalentScout.chat_engine import MODEL, TASK_OPTIONS, QUESTION_ATTEMPTS, parse_questions
 
 class ResumeAnalyzer:
     def __init__(self):
         self.query_engine = None
+        self.question_engine = None
+        self.structured_llm = None
         self.resume_content = None
         self.interview_questions = []
         
@@ -25,7 +28,15 @@ class ResumeAnalyzer:
             )
             
             # Initialize LLM
-            llm = Ollama(model="llama3.2:latest", request_timeout=120.0)
+            llm = Ollama(model=MODEL, request_timeout=120.0)
+
+            # JSON-mode LLM for question generation, capped per TASK_OPTIONS
+            self.structured_llm = Ollama(
+                model=MODEL,
+                request_timeout=120.0,
+                json_mode=True,
+                additional_kwargs=TASK_OPTIONS["resume_questions"]
+            )
             
             # Configure settings
             Settings.embed_model = embed_model
@@ -115,6 +126,23 @@ class ResumeAnalyzer:
             self.query_engine.update_prompts(
                 {"response_synthesizer:text_qa_template": qa_prompt_tmpl}
             )
+
+            # Structured engine for question generation: no THINKING section, JSON only
+            questions_prompt_tmpl = PromptTemplate(
+                "You are an expert technical recruiter analyzing a candidate's resume. "
+                "Context information is below.\n"
+                "---------------------\n"
+                "{context_str}\n"
+                "---------------------\n"
+                "Reply only with JSON of the form "
+                '{"questions": [{"question": "...?", "topic": "skills|projects|role"}]}.\n\n'
+                "Query: {query_str}\n"
+            )
+            self.question_engine = index.as_query_engine(
+                llm=self.structured_llm,
+                similarity_top_k=2,
+                text_qa_template=questions_prompt_tmpl
+            )
             
             # Generate initial questions based on resume
             self.generate_interview_questions()
@@ -127,30 +155,30 @@ class ResumeAnalyzer:
 
     def generate_interview_questions(self) -> List[str]:
         """Generate interview questions based on the resume content."""
-        if not self.query_engine:
+        if not self.question_engine:
             return []
         
-        prompts = [
-            "What technical skills does the candidate have? Generate 2 specific technical questions based on their strongest skills.",
-            "Based on the candidate's project experience, generate 2 questions about their most significant projects.",
-            "Looking at the candidate's work history, generate 1 question about their role and responsibilities."
-        ]
+        prompt = (
+            "Generate 5 interview questions: 2 specific technical questions based on the candidate's "
+            "strongest skills, 2 questions about their most significant projects, and 1 question about "
+            "their role and responsibilities in their work history."
+        )
         
         questions = []
-        for prompt in prompts:
+        for _ in range(QUESTION_ATTEMPTS):
             try:
-                response = self.query_engine.query(prompt)
-                if response and hasattr(response, 'response'):
-                    # Extract questions from the response
-                    response_text = response.response
-                    if "RESPONSE:" in response_text:
-                        questions_part = response_text.split("RESPONSE:")[1].strip()
-                        questions.extend([q.strip() for q in questions_part.split('\n') if '?' in q])
+                response = self.question_engine.query(prompt)
+                response_text = response.response if hasattr(response, 'response') else str(response)
+                parsed = parse_questions(response_text)
             except Exception as e:
-                st.warning(f"Error generating question for prompt: {prompt}. Error: {str(e)}")
+                st.warning(f"Error generating resume questions. Error: {str(e)}")
                 continue
+            if len(parsed) > len(questions):
+                questions = parsed
+            if len(questions) >= 5:
+                break
         
-        self.interview_questions = questions[:5]  # Keep top 5 questions
+        self.interview_questions = [q.text for q in questions]
         return self.interview_questions
     
     def ask_question(self, question: str) -> Optional[str]:
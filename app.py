@@ -1,6 +1,13 @@
+import tempfile
+from datetime import timedelta
 import streamlit as st
-from TalentScout.database import initialize_database, get_all_candidates, get_conversations_by_candidate_id
-from TalentScout.chat_capabilities import ChatManager
+from TalentScout.database import (
+    initialize_database, get_all_candidates, get_conversations_by_candidate_id,
+    archive_stale_conversations, compact_database, get_archive_stats
+)
+from TalentScout.chat_capabilities import ChatManager, ChatState
+from TalentScout.export import export, FORMATS
+from TalentScout.matching import get_matcher, RoleSpec
 
 # Initialize the database
 initialize_database()
@@ -137,6 +144,11 @@ def candidate_chat():
             role="assistant",
             content=bot_response
         )
+
+        # Finished interviews go to compressed cold storage
+        if st.session_state.chat_manager.state == ChatState.ENDING:
+            from TalentScout.database import archive_conversations
+            archive_conversations(st.session_state.candidate_id)
         
         # Force a rerun to update the chat immediately
         st.rerun()
@@ -161,6 +173,35 @@ def agency_dashboard():
                 st.session_state.selected_candidate = candidate
                 st.experimental_rerun()
     
+    st.subheader("Rank Candidates for a Role")
+    with st.form("ranking_form"):
+        required_skills = st.text_input(
+            "Required skills (comma separated)",
+            help="Candidates must have at least one required skill; having more of them ranks higher."
+        )
+        nice_to_have_skills = st.text_input("Nice-to-have skills (comma separated)")
+        min_years = st.number_input("Minimum years of experience", min_value=0, step=1)
+        role_location = st.text_input("Location (optional)")
+        top_k = st.number_input("Number of candidates", min_value=1, value=10, step=1)
+        ranked = st.form_submit_button("Rank")
+    if ranked:
+        role = RoleSpec(
+            required_skills=required_skills.split(","),
+            nice_to_have_skills=nice_to_have_skills.split(","),
+            min_years_of_experience=min_years,
+            location=role_location or None,
+        )
+        matches = get_matcher().rank(role, top_k=int(top_k))
+        candidates_by_id = {candidate[0]: candidate for candidate in candidates}
+        if matches:
+            for candidate_id, score in matches:
+                candidate = candidates_by_id.get(candidate_id)
+                if candidate:
+                    st.write(f"**{score:.2f}** — {candidate[1]} ({candidate[2]}), "
+                             f"{candidate[4]} years, {candidate[6]}: {candidate[7]}")
+        else:
+            st.info("No candidates match this role.")
+
     # If a candidate is selected, display detailed information and conversation history
     if "selected_candidate_id" in st.session_state:
         candidate_id = st.session_state.selected_candidate_id
@@ -174,6 +215,49 @@ def agency_dashboard():
         else:
             st.info("No conversation history found for this candidate.")
 
+    st.subheader("Transcript Archive")
+    older_than_days = st.number_input("Archive transcripts inactive for (days)", min_value=0, value=30, step=1)
+    if st.button("Archive stale transcripts"):
+        archived = archive_stale_conversations(older_than_days)
+        compact_database()
+        st.success(f"Archived {archived} messages.")
+    stats = get_archive_stats()
+    st.write(
+        f"{stats['archived_transcripts']} transcripts ({stats['archived_messages']} messages) archived, "
+        f"{stats['raw_bytes']:,} bytes stored in {stats['compressed_bytes']:,} "
+        f"(saved {stats['bytes_saved']:,} bytes, {stats['compression_ratio']:.1f}x). "
+        f"Average archive read: {stats['avg_read_ms']:.2f} ms over {stats['archive_reads']} reads."
+    )
+
+    st.subheader("Export Data")
+    export_table = st.selectbox("Table", ["conversations", "candidates"])
+    export_format = st.selectbox("Format", FORMATS)
+    export_position = st.text_input("Position filter (optional)")
+    export_range = st.date_input("Conversation date range (optional)", value=[])
+    if st.button("Prepare export"):
+        start_date = end_date = None
+        if len(export_range) == 2:
+            start_date = export_range[0].isoformat()
+            end_date = (export_range[1] + timedelta(days=1)).isoformat()
+        # Stream to a temporary file so the export never sits in a Python list
+        if export_format == "parquet":
+            output = tempfile.TemporaryFile(mode="w+b")
+        else:
+            output = tempfile.TemporaryFile(mode="w+", newline="", encoding="utf-8")
+        with output:
+            try:
+                count = export(export_table, export_format, output, start_date=start_date,
+                               end_date=end_date, position=export_position or None)
+            except ImportError as e:
+                st.error(str(e))
+                return
+            output.seek(0)
+            st.download_button(
+                f"Download {count} rows",
+                data=output.read(),
+                file_name=f"{export_table}.{export_format}",
+            )
+
 # --- Main Routing ---
 def main():
     st.title("TalentScout Hiring Assistant")
@@ -0,0 +1,68 @@
+"""
+Measure streaming export throughput on a synthetic database.
+
+Usage: python benchmarks/export_benchmark.py [--messages 2000000] [--database bench.db]
+"""
+import argparse
+import os
+import random
+import resource
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TalentScout.database import initialize_database
+from TalentScout.export import export
+
+POSITIONS = ["Backend Engineer", "Frontend Engineer", "Data Scientist", "DevOps Engineer"]
+
+
+def build_database(path, candidates, messages_per_candidate):
+    conn = sqlite3.connect(path)
+    initialize_database(conn)
+    rng = random.Random(0)
+    with conn:
+        conn.executemany(
+            "INSERT INTO candidates (full_name, email, phone, years_of_experience, desired_position, "
+            "current_location, tech_stack) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((f"Candidate {i}", f"candidate{i}@example.com", "555-0100", rng.randint(0, 20),
+              rng.choice(POSITIONS), "Remote", "python, sql") for i in range(candidates)),
+        )
+        conn.executemany(
+            "INSERT INTO conversations (candidate_id, role, content, date) VALUES (?, ?, ?, ?)",
+            ((i // messages_per_candidate + 1, "assistant" if i % 2 else "user",
+              "Thank you for your response. " * rng.randint(1, 20),
+              f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 12:00:00")
+             for i in range(candidates * messages_per_candidate)),
+        )
+    return conn
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--messages", type=int, default=2_000_000)
+    parser.add_argument("--messages-per-candidate", type=int, default=40)
+    parser.add_argument("--database", default="export_benchmark.db")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.database):
+        start = time.perf_counter()
+        build_database(args.database, args.messages // args.messages_per_candidate,
+                       args.messages_per_candidate).close()
+        print(f"Built {args.messages} messages in {time.perf_counter() - start:.1f}s")
+
+    conn = sqlite3.connect(args.database)
+    for fmt in ["jsonl", "csv"]:
+        with open(os.devnull, "w") as output:
+            start = time.perf_counter()
+            count = export("conversations", fmt, output, conn=conn)
+            elapsed = time.perf_counter() - start
+        print(f"{fmt}: {count} rows in {elapsed:.1f}s ({count / elapsed:,.0f} rows/s)")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"Peak RSS: {peak:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
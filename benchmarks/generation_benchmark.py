@@ -0,0 +1,166 @@
+"""
+Compare generated tokens and latency of the old free-form prompts with the capped JSON prompts.
+
+Requires a running Ollama server with the model from TalentScout.chat_engine.MODEL pulled.
+
+Usage: python benchmarks/generation_benchmark.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+
+import ollama
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TalentScout.chat_engine import MODEL, TASK_OPTIONS, parse_questions
+
+TECH_STACK = "python, django, postgresql, docker"
+RESUME = (
+    "Jane Doe - Backend Engineer, 5 years.\n"
+    "Acme Corp (2021-now): led migration of a Django monolith to services on Kubernetes; "
+    "built a Kafka ingestion pipeline handling 20k events/s.\n"
+    "Globex (2019-2021): developed REST APIs in Flask and PostgreSQL; introduced CI with GitHub Actions.\n"
+    "Skills: Python, Django, Flask, PostgreSQL, Redis, Docker, Kubernetes, Kafka, AWS."
+)
+QUESTION = "How does Django's ORM avoid the N+1 query problem?"
+ANSWER = "You can use select_related for foreign keys and prefetch_related for many-to-many relations."
+
+# Prompts as they were before structured generation
+OLD_RESUME_TEMPLATE = (
+    "You are an expert technical recruiter analyzing a candidate's resume. "
+    "Context information is below.\n"
+    "---------------------\n"
+    "{context_str}\n"
+    "---------------------\n"
+    "Based on this context, think carefully about the candidate's background "
+    "and generate relevant technical questions.\n\n"
+    "THINKING:\n"
+    "[Your analysis of the candidate's experience]\n\n"
+    "RESPONSE:\n"
+    "[Your technical questions or insights]\n\n"
+    "Query: {query_str}\n"
+)
+OLD_RESUME_QUERIES = [
+    "What technical skills does the candidate have? Generate 2 specific technical questions based on their strongest skills.",
+    "Based on the candidate's project experience, generate 2 questions about their most significant projects.",
+    "Looking at the candidate's work history, generate 1 question about their role and responsibilities."
+]
+
+# Prompts as sent by TechnicalAssessment, ResumeAnalyzer and ChatManager today
+NEW_RESUME_TEMPLATE = (
+    "You are an expert technical recruiter analyzing a candidate's resume. "
+    "Context information is below.\n"
+    "---------------------\n"
+    "{context_str}\n"
+    "---------------------\n"
+    "Reply only with JSON of the form "
+    '{"questions": [{"question": "...?", "topic": "skills|projects|role"}]}.\n\n'
+    "Query: {query_str}\n"
+)
+NEW_RESUME_QUERY = (
+    "Generate 5 interview questions: 2 specific technical questions based on the candidate's "
+    "strongest skills, 2 questions about their most significant projects, and 1 question about "
+    "their role and responsibilities in their work history."
+)
+
+EVALUATION_CONTEXT = (
+    f"Current technical interview context:\n- Position: Backend Engineer\n- Experience: 5 years\n"
+    f"- Tech Stack: {TECH_STACK}\n\nPrevious question: {QUESTION}\nCandidate's answer: {ANSWER}\n\n"
+)
+EVALUATION_SYSTEM = (
+    "You are an expert technical interviewer for software engineering positions. Your responses should be:\n"
+    "1. Relevant to the candidate's tech stack and experience level\n"
+    "2. Technical and specific, but respectful and encouraging\n"
+    "3. Based on industry best practices and real-world scenarios\n"
+    "Analyze the candidate's answer and provide constructive feedback before moving to the next question."
+)
+
+
+def technical_questions(structured):
+    if structured:
+        system = ("You are an expert technical interviewer. Generate specific, technical questions based on the candidate's tech stack. "
+                  'Reply only with JSON of the form {"questions": [{"question": "...?", "topic": "..."}]}.')
+    else:
+        system = "You are an expert technical interviewer. Generate specific, technical questions based on the candidate's tech stack."
+    messages = [
+        {"role": "system", "content": system},
+        {"role": "user", "content": f"Generate 5 technical interview questions for a candidate who knows: {TECH_STACK}. Make questions specific to these technologies."},
+    ]
+    if structured:
+        return [(messages, "json", TASK_OPTIONS["technical_questions"])]
+    return [(messages, "", None)]
+
+
+def resume_questions(structured):
+    if structured:
+        # Rendered like llama-index's SafeFormatter: only the named placeholders are replaced
+        content = NEW_RESUME_TEMPLATE.replace("{context_str}", RESUME).replace("{query_str}", NEW_RESUME_QUERY)
+        return [([{"role": "user", "content": content}], "json", TASK_OPTIONS["resume_questions"])]
+    return [
+        ([{"role": "user", "content": OLD_RESUME_TEMPLATE.format(context_str=RESUME, query_str=query)}], "", None)
+        for query in OLD_RESUME_QUERIES
+    ]
+
+
+def answer_evaluation(structured):
+    if structured:
+        instruction = "Provide a brief, technical evaluation of the answer in 2-3 sentences. Do not write the next question."
+        options = TASK_OPTIONS["answer_evaluation"]
+    else:
+        instruction = "Provide a brief, technical evaluation of the answer and transition to the next question."
+        options = None
+    messages = [
+        {"role": "system", "content": EVALUATION_SYSTEM},
+        {"role": "user", "content": EVALUATION_CONTEXT + instruction},
+    ]
+    return [(messages, "", options)]
+
+
+def old_question_count(text):
+    if "RESPONSE:" in text:
+        text = text.split("RESPONSE:")[1]
+    return len([line for line in text.split("\n") if "?" in line])
+
+
+TASKS = {
+    "technical_questions": technical_questions,
+    "resume_questions": resume_questions,
+    "answer_evaluation": answer_evaluation,
+}
+
+
+def run(task, structured):
+    """Run every call one task needs and return (generated tokens, eval seconds, total seconds, questions)."""
+    tokens = eval_seconds = total_seconds = 0
+    questions = 0
+    for messages, fmt, options in TASKS[task](structured):
+        response = ollama.chat(model=MODEL, messages=messages, format=fmt, options=options)
+        tokens += response.get("eval_count", 0)
+        eval_seconds += response.get("eval_duration", 0) / 1e9
+        total_seconds += response.get("total_duration", 0) / 1e9
+        content = response["message"]["content"]
+        if task != "answer_evaluation":
+            questions += len(parse_questions(content)) if structured else old_question_count(content)
+    return tokens, eval_seconds, total_seconds, questions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    for task in TASKS:
+        for structured in (False, True):
+            results = [run(task, structured) for _ in range(args.runs)]
+            tokens, eval_seconds, total_seconds, questions = (statistics.median(r[i] for r in results) for i in range(4))
+            label = "after" if structured else "before"
+            summary = f"{task:20} {label:6}: {tokens:6.0f} tokens, {eval_seconds:6.2f}s eval, {total_seconds:6.2f}s total"
+            if task != "answer_evaluation":
+                summary += f", {questions:.0f} questions, {sum(r[3] == 0 for r in results)}/{args.runs} runs empty"
+            print(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Measure candidate ranking latency on synthetic candidates.
+
+Usage: python benchmarks/matching_benchmark.py [--candidates 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from TalentScout.matching import CandidateMatcher, RoleSpec
+
+SKILLS = [
+    "Python", "Django", "Flask", "FastAPI", "JavaScript", "TypeScript", "React.js", "Vue", "Angular",
+    "Node.js", "Java", "Spring", "Go", "Rust", "C++", "C#", "SQL", "Postgres", "MySQL", "MongoDB",
+    "Redis", "Docker", "k8s", "AWS", "GCP", "Azure", "Terraform", "Kafka", "Spark", "ML",
+    "TensorFlow", "PyTorch", "sklearn", "Pandas", "NumPy", "GraphQL", "REST", "Linux", "Git", "CI/CD",
+]
+SKILLS += [f"Framework{i}" for i in range(460)]
+LOCATIONS = ["New York", "San Francisco", "London", "Berlin", "Bangalore", "Remote", "Toronto", "Mumbai"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--candidates", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    matcher = CandidateMatcher()
+    start = time.perf_counter()
+    for candidate_id in range(1, args.candidates + 1):
+        tech_stack = ", ".join(rng.sample(SKILLS[:40], 4) + rng.sample(SKILLS, 4))
+        matcher.add_candidate(candidate_id, tech_stack, rng.randint(0, 20), rng.choice(LOCATIONS))
+    role = RoleSpec(
+        required_skills=["python", "django", "postgresql"],
+        nice_to_have_skills=["docker", "aws", "react"],
+        min_years_of_experience=3,
+        location="new york",
+    )
+    matcher.rank(role)
+    print(f"Indexed {len(matcher)} candidates in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    for _ in range(args.queries):
+        matches = matcher.rank(role, top_k=10)
+    elapsed = (time.perf_counter() - start) * 1000 / args.queries
+    print(f"rank(top_k=10): {elapsed:.2f} ms per query, best score {matches[0][1]:.2f}")
+
+    start = time.perf_counter()
+    matcher.add_candidate(args.candidates + 1, "Python, Django, Postgres, Docker, AWS, React", 5, "New York")
+    matches = matcher.rank(role, top_k=10)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"insert + rank: {elapsed:.2f} ms, new candidate ranked first: {matches[0][0] == args.candidates + 1}")
+
+
+if __name__ == "__main__":
+    main()